@@ -1,7 +1,12 @@
-from abc import ABC, abstractmethod
-from typing import List, Generator
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List
+import sys
+import numpy as np
 
 class House:
+    __slots__ = ("address", "residents")
+
     def __init__(self, address: str, residents: int) -> None:
         self.address: str = address
         self.residents: int = residents
@@ -9,62 +14,105 @@ class House:
     def is_empty(self) -> bool:
         return self.residents == 0
 
-class TraversalStrategy(ABC):
-    @abstractmethod
-    def traverse(self, matrix: List[List[House]]) -> Generator[House, None, None]:
-        pass
+@dataclass
+class CityGrid:
+    addresses: np.ndarray
+    residents: np.ndarray
+
+    @classmethod
+    def from_houses(cls, matrix: List[List[House]]) -> "CityGrid":
+        addresses: np.ndarray = np.array([[h.address for h in row] for row in matrix], dtype=object)
+        residents: np.ndarray = np.array([[h.residents for h in row] for row in matrix], dtype=np.int32)
+        return cls(addresses, residents)
+
+    @property
+    def shape(self) -> tuple:
+        return self.residents.shape
+
+    def empty_mask(self) -> np.ndarray:
+        return self.residents == 0
+
+class TraversalStrategy:
+    def traverse(self, grid: CityGrid) -> np.ndarray:
+        raise NotImplementedError
 
 class RowByRowTraversal(TraversalStrategy):
-    def traverse(self, matrix: List[List[House]]) -> Generator[House, None, None]:
-        for row in matrix:
-            for house in row:
-                yield house
+    def traverse(self, grid: CityGrid) -> np.ndarray:
+        return np.flatnonzero(grid.empty_mask())
+
+@lru_cache(maxsize=None)
+def _spiral_perm(rows: int, cols: int) -> np.ndarray:
+    perm: np.ndarray = np.empty(rows * cols, dtype=np.int32)
+    i: int = 0
+    top: int = 0
+    bottom: int = rows - 1
+    left: int = 0
+    right: int = cols - 1
+
+    while left <= right and top <= bottom:
+        for col in range(left, right + 1):
+            perm[i] = top * cols + col
+            i += 1
+        top += 1
+
+        for row in range(top, bottom + 1):
+            perm[i] = row * cols + right
+            i += 1
+        right -= 1
+
+        if top <= bottom:
+            for col in range(right, left - 1, -1):
+                perm[i] = bottom * cols + col
+                i += 1
+            bottom -= 1
+
+        if left <= right:
+            for row in range(bottom, top - 1, -1):
+                perm[i] = row * cols + left
+                i += 1
+            left += 1
+
+    perm.flags.writeable = False
+    return perm
 
 class SpiralTraversal(TraversalStrategy):
-    def traverse(self, matrix: List[List[House]]) -> Generator[House, None, None]:
-        top: int = 0
-        bottom: int = len(matrix) - 1
-        left: int = 0
-        right: int = len(matrix[0]) - 1
-
-        while left <= right and top <= bottom:
-            for col in range(left, right + 1):
-                yield matrix[top][col]
-            top += 1
-
-            for row in range(top, bottom + 1):
-                yield matrix[row][right]
-            right -= 1
-
-            if top <= bottom:
-                for col in range(right, left - 1, -1):
-                    yield matrix[bottom][col]
-                bottom -= 1
-
-            if left <= right:
-                for row in range(bottom, top - 1, -1):
-                    yield matrix[row][left]
-                left += 1
+    def traverse(self, grid: CityGrid) -> np.ndarray:
+        perm: np.ndarray = _spiral_perm(*grid.shape)
+        return perm[grid.residents.take(perm) == 0]
+
+class TiledSpiralTraversal(TraversalStrategy):
+    def __init__(self, block: int = 64) -> None:
+        self.block: int = block
+
+    def traverse(self, grid: CityGrid) -> np.ndarray:
+        rows, cols = grid.shape
+        b: int = self.block
+        tile_cols: int = -(-cols // b)
+        hits: List[np.ndarray] = []
+        for tile in _spiral_perm(-(-rows // b), tile_cols):
+            ti: int = int(tile) // tile_cols * b
+            tj: int = int(tile) % tile_cols * b
+            local: np.ndarray = np.argwhere(grid.residents[ti:ti + b, tj:tj + b] == 0)
+            hits.append((local[:, 0] + ti) * cols + local[:, 1] + tj)
+        return np.concatenate(hits) if hits else np.empty(0, dtype=np.intp)
 
 class City:
-    def __init__(self, matrix: List[List[House]], strategy: TraversalStrategy) -> None:
-        self.matrix: List[List[House]] = matrix
+    def __init__(self, grid: CityGrid, strategy: TraversalStrategy) -> None:
+        self.grid: CityGrid = grid
         self.strategy: TraversalStrategy = strategy
 
     def set_strategy(self, strategy: TraversalStrategy) -> None:
         self.strategy = strategy
 
     def print_empty_houses(self) -> None:
-        print("Порожні будинки:")
-        for house in self.strategy.traverse(self.matrix):
-            if house.is_empty():
-                print(house.address)
+        empties: List[str] = self.grid.addresses.flat[self.strategy.traverse(self.grid)].tolist()
+        sys.stdout.write("Порожні будинки:\n" + "".join(a + "\n" for a in empties))
 
-city_map: List[List[House]] = [
+city_map: CityGrid = CityGrid.from_houses([
     [House("A1", 3), House("A2", 0), House("A3", 1)],
     [House("B1", 0), House("B2", 2), House("B3", 0)],
     [House("C1", 1), House("C2", 0), House("C3", 4)]
-]
+])
 
 print("Обхід по рядках :")
 city = City(city_map, RowByRowTraversal())
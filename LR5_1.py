@@ -7,21 +7,24 @@
 #Користь шаблону:Дозволяє гнучко будувати складні об’єкти крок за кроком.
 # Запобігає створенню конструкторів із 10+ параметрами.
 # Дозволяє мати різні стилі побудови (наприклад, “М’ясна піца”, “Веганська піца”) без дублювання коду.
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 class Pizza:
+    __slots__ = ("size", "dough", "sauce", "toppings")
+
     def __init__(self) -> None:
         self.size: Optional[str] = None
         self.dough: Optional[str] = None
         self.sauce: Optional[str] = None
-        self.toppings: List[str] = []
+        self.toppings: Sequence[str] = []
 
     def __str__(self) -> str:
-        return f"Pizza({self.size}, {self.dough}, {self.sauce}, {self.toppings})"
+        return f"Pizza({self.size}, {self.dough}, {self.sauce}, {list(self.toppings)})"
 
 class PizzaBuilder:
     def __init__(self) -> None:
         self.pizza: Pizza = Pizza()
+        self.toppings: List[str] = []
 
     def set_size(self, size: str) -> "PizzaBuilder":
         self.pizza.size = size
@@ -36,11 +39,15 @@ class PizzaBuilder:
         return self
 
     def add_topping(self, topping: str) -> "PizzaBuilder":
-        self.pizza.toppings.append(topping)
+        self.toppings.append(topping)
         return self
 
     def build(self) -> Pizza:
-        return self.pizza
+        pizza: Pizza = self.pizza
+        pizza.toppings = tuple(self.toppings)
+        self.pizza = Pizza()
+        self.toppings = []
+        return pizza
 
 pizza: Pizza = (
     PizzaBuilder()
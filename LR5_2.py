@@ -5,7 +5,8 @@
 # Покращує сумісність між новими та старими системами.
 # Значно економить час при інтеграції бібліотек або застарілого коду.
 import math
-from typing import Protocol
+from typing import Protocol, Tuple
+import numpy as np
 
 class NewMover(Protocol):
     def move(self, x: float, y: float) -> None:
@@ -33,6 +34,19 @@ class NPCAdapter:
         self.npc.set_speed(speed)
         self.npc.start()
 
+    @staticmethod
+    def headings(xs: np.ndarray, ys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        degrees: np.ndarray = np.degrees(np.arctan2(ys, xs)).astype(np.int32)
+        speeds: np.ndarray = np.hypot(xs, ys).astype(np.int32)
+        return degrees, speeds
+
+    def move_batch(self, xs: np.ndarray, ys: np.ndarray) -> None:
+        degrees, speeds = self.headings(xs, ys)
+        for degree, speed in zip(degrees.tolist(), speeds.tolist()):
+            self.npc.set_direction(degree)
+            self.npc.set_speed(speed)
+            self.npc.start()
+
 old_npc: OldNPC = OldNPC()
 adapted_npc: NewMover = NPCAdapter(old_npc)
 
@@ -6,10 +6,11 @@
 #Гарантує єдиний алгоритм, але з можливістю замінювати окремі частини.
 #Мінімізує дублювання коду.
 #Додає нових ворогів без зміни базової логіки.
-from abc import ABC, abstractmethod
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+import os
 
-class Enemy(ABC):
+class Enemy:
     def attack_sequence(self) -> None:
         self.find_target()
         self.move_to_target()
@@ -23,9 +24,8 @@ class Enemy(ABC):
     def move_to_target(self) -> None:
         print("Enemy moves closer")
 
-    @abstractmethod
     def attack(self) -> None:
-        pass
+        raise NotImplementedError
 
     def retreat(self) -> None:
         print("Enemy moves back")
@@ -43,6 +43,12 @@ class Dragon(Enemy):
     def attack(self) -> None:
         print("Dragon breathes fire!")
 
+def run_all(enemies: List[Enemy], max_workers: Optional[int] = None) -> None:
+    if max_workers is None:
+        max_workers = os.cpu_count()
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        list(ex.map(lambda e: e.attack_sequence(), enemies))
+
 enemies: List[Enemy] = [Zombie(), Robot(), Dragon()]
 
 for e in enemies:
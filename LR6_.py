@@ -1,9 +1,10 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
+from bisect import bisect_left, insort
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
 import uuid
 import sys
 
@@ -55,6 +56,10 @@ class ScheduleSlot:
         """Звільняє годину після скасування або перенесення запису."""
         self.is_available = True
 
+def _slot_order(slot: ScheduleSlot) -> Tuple[datetime, str]:
+    """Ключ впорядкування годин у розкладі."""
+    return slot.date_time, slot.id
+
 @dataclass
 class Appointment:
     """
@@ -166,6 +171,29 @@ class DefaultSlotValidation(SlotValidationStrategy):
 
 #  FACADE 
 
+class _SlotsView(Sequence[ScheduleSlot]):
+    """
+    Представлення розкладу лише для читання.
+    Не копіює список, тому доступ до нього коштує O(1).
+    """
+    __slots__ = ("_items",)
+
+    def __init__(self, items: List[ScheduleSlot]) -> None:
+        self._items = items
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[ScheduleSlot]:
+        return iter(self._items)
+
+    def __repr__(self) -> str:
+        return f"_SlotsView({self._items!r})"
+
+
 class MedicalSystemFacade:
     """
     Фасад медичної системи.
@@ -181,8 +209,14 @@ class MedicalSystemFacade:
     ) -> None:
         self.users: List[User] = []
         self.doctors: List[Doctor] = []
-        self.slots: List[ScheduleSlot] = []
+        self._slots: List[ScheduleSlot] = []
+        self._slots_view: _SlotsView = _SlotsView(self._slots)
         self.appointments: List[Appointment] = []
+        self.users_by_name: Dict[str, User] = {}
+        self.appointments_by_id: Dict[str, Appointment] = {}
+        self.appointments_by_user: Dict[str, List[Appointment]] = {}
+        self._available_slots: Set[int] = set()
+        self._available_sorted: List[ScheduleSlot] = []
         self.current_user: Optional[User] = None
 
         self.factory = factory
@@ -191,26 +225,39 @@ class MedicalSystemFacade:
 
     def register(self, name: str, password: str) -> bool:
         """Реєструє нового користувача."""
-        if any(u.name == name for u in self.users):
+        if name in self.users_by_name:
             return False
-        self.users.append(User(str(uuid.uuid4()), name, password))
+        user = User(str(uuid.uuid4()), name, password)
+        self.users.append(user)
+        self.users_by_name[name] = user
         return True
 
     def login(self, name: str, password: str) -> bool:
         """Авторизує користувача."""
-        for user in self.users:
-            if user.name == name and user.password == password:
-                self.current_user = user
-                return True
-        return False
+        user = self.users_by_name.get(name)
+        if user is None or user.password != password:
+            return False
+        self.current_user = user
+        return True
 
     def list_doctors(self) -> List[Doctor]:
         """Повертає список лікарів."""
         return self.doctors
 
+    @property
+    def slots(self) -> Sequence[ScheduleSlot]:
+        """Повертає всі години розкладу (лише для читання)."""
+        return self._slots_view
+
+    def add_slot(self, slot: ScheduleSlot) -> None:
+        """Додає годину прийому до розкладу."""
+        self._slots.append(slot)
+        if slot.is_available:
+            self._release(slot)
+
     def available_slots(self) -> List[ScheduleSlot]:
-        """Повертає всі доступні години."""
-        slots = [s for s in self.slots if self.validator.is_available(s)]
+        """Повертає всі доступні години, впорядковані за часом."""
+        slots = [s for s in self._available_sorted if self.validator.is_available(s)]
         if not slots and self.current_user:
             self.notifier.send(self.current_user, "Немає вільних годин")
         return slots
@@ -226,16 +273,20 @@ class MedicalSystemFacade:
             return
 
         appointment = self.factory.create(self.current_user, doctor, slot)
+        self._reserve(slot)
         self.appointments.append(appointment)
+        self.appointments_by_id[appointment.id] = appointment
+        self.appointments_by_user.setdefault(self.current_user.id, []).append(appointment)
         self.notifier.send(self.current_user, "Запис успішно створено")
 
     def cancel_appointment(self, appointment_id: str) -> None:
         """Скасовує існуючий запис."""
-        for appointment in self.user_appointments():
-            if appointment.id == appointment_id:
-                appointment.cancel()
-                self.notifier.send(self.current_user, "Запис скасовано")
-                return
+        appointment = self._own_appointment(appointment_id)
+        if appointment is None:
+            return
+        appointment.cancel()
+        self._release(appointment.slot)
+        self.notifier.send(self.current_user, "Запис скасовано")
 
     def reschedule_appointment(self, appointment_id: str, new_slot: ScheduleSlot) -> None:
         """Переносить запис на іншу годину."""
@@ -243,22 +294,59 @@ class MedicalSystemFacade:
             self.notifier.send(self.current_user, "Година зайнята")
             return
 
-        for appointment in self.user_appointments():
-            if appointment.id == appointment_id:
-                appointment.reschedule(new_slot)
-                self.notifier.send(self.current_user, "Запис перенесено")
-                return
+        appointment = self._own_appointment(appointment_id)
+        if appointment is None:
+            return
+        old_slot = appointment.slot
+        appointment.reschedule(new_slot)
+        self._release(old_slot)
+        self._reserve(new_slot)
+        self.notifier.send(self.current_user, "Запис перенесено")
 
     def user_appointments(self) -> List[Appointment]:
         """Повертає активні записи поточного користувача."""
         if not self.current_user:
             return []
         return [
-            a for a in self.appointments
-            if a.patient == self.current_user
-            and a.status == AppointmentStatus.ACTIVE
+            a for a in self.appointments_by_user.get(self.current_user.id, [])
+            if a.status == AppointmentStatus.ACTIVE
         ]
 
+    def _reserve(self, slot: ScheduleSlot) -> None:
+        """Прибирає годину з індексу вільних годин."""
+        if id(slot) in self._available_slots:
+            self._available_slots.remove(id(slot))
+            del self._available_sorted[self._sorted_index(slot)]
+
+    def _release(self, slot: ScheduleSlot) -> None:
+        """Повертає годину до індексу вільних годин."""
+        if id(slot) not in self._available_slots:
+            self._available_slots.add(id(slot))
+            insort(self._available_sorted, slot, key=_slot_order)
+
+    def _sorted_index(self, slot: ScheduleSlot) -> int:
+        """Знаходить позицію саме цієї години в упорядкованому індексі."""
+        index = self._available_sorted
+        key = _slot_order(slot)
+        i = bisect_left(index, key, key=_slot_order)
+        while i < len(index) and _slot_order(index[i]) == key:
+            if index[i] is slot:
+                return i
+            i += 1
+        # Ключ години змінився після додавання до індексу.
+        return next(i for i, s in enumerate(index) if s is slot)
+
+    def _own_appointment(self, appointment_id: str) -> Optional[Appointment]:
+        """Повертає активний запис поточного користувача за ідентифікатором."""
+        appointment = self.appointments_by_id.get(appointment_id)
+        if (
+            appointment is None
+            or appointment.patient != self.current_user
+            or appointment.status != AppointmentStatus.ACTIVE
+        ):
+            return None
+        return appointment
+
 
 #  CONSOLE MENU 
 
@@ -320,15 +408,17 @@ class ConsoleMenu:
         for i, doctor in enumerate(self.system.list_doctors(), 1):
             print(f"{i}. {doctor.name}")
 
-    def show_slots(self) -> None:
-        for i, slot in enumerate(self.system.available_slots(), 1):
+    def show_slots(self) -> List[ScheduleSlot]:
+        slots: List[ScheduleSlot] = self.system.available_slots()
+        for i, slot in enumerate(slots, 1):
             print(f"{i}. {slot.date_time}")
+        return slots
 
     def create_appointment(self) -> None:
         self.show_doctors()
         doctor: Doctor = self.system.doctors[int(input("Лікар: ")) - 1]
-        self.show_slots()
-        slot: ScheduleSlot = self.system.available_slots()[int(input("Година: ")) - 1]
+        slots: List[ScheduleSlot] = self.show_slots()
+        slot: ScheduleSlot = slots[int(input("Година: ")) - 1]
         self.system.create_appointment(doctor, slot)
 
     def cancel_appointment(self) -> None:
@@ -342,8 +432,8 @@ class ConsoleMenu:
         for i, a in enumerate(apps, 1):
             print(f"{i}. {a.doctor.name} | {a.slot.date_time}")
         appointment: Appointment = apps[int(input("Запис: ")) - 1]
-        self.show_slots()
-        new_slot: ScheduleSlot = self.system.available_slots()[int(input("Нова година: ")) - 1]
+        slots: List[ScheduleSlot] = self.show_slots()
+        new_slot: ScheduleSlot = slots[int(input("Нова година: ")) - 1]
         self.system.reschedule_appointment(appointment.id, new_slot)
 
     def show_appointments(self) -> None:
@@ -365,7 +455,7 @@ def create_system() -> MedicalSystemFacade:
 
     now: datetime = datetime.now()
     for i in range(5):
-        system.slots.append(
+        system.add_slot(
             ScheduleSlot(str(i), now.replace(hour=9 + i, minute=0))
         )
 
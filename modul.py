@@ -7,10 +7,26 @@
 #Врахувати всі можливі комбінації податків та вивести кінцеву сум.
 #Вказати шаблон, який доцільно використати для розв'язування задачі.
 from __future__ import annotations  
-from abc import ABC, abstractmethod
-from typing import List
+from enum import IntEnum
+from typing import Dict, List, Optional
+import numpy as np
+
+class PaymentMethod(IntEnum):
+    ON_DELIVERY = 0
+    TRANSFER = 1
+    CREDIT = 2
+    CARD = 3
+
+PAYMENT_METHODS: Dict[str, PaymentMethod] = {
+    "при отриманні": PaymentMethod.ON_DELIVERY,
+    "переказ": PaymentMethod.TRANSFER,
+    "кредит": PaymentMethod.CREDIT,
+    "карткою": PaymentMethod.CARD,
+}
 
 class Product:
+    __slots__ = ("name", "quantity", "price")
+
     def __init__(self, name: str, quantity: int, price: float) -> None:
         self.name: str = name
         self.quantity: int = quantity
@@ -19,10 +35,9 @@ class Product:
     def total(self) -> float:
         return self.quantity * self.price
 
-class PriceComponent(ABC):
-    @abstractmethod
+class PriceComponent:
     def get_price(self) -> float:
-        pass
+        raise NotImplementedError
 
 class BaseOrder(PriceComponent):
     def __init__(self, products: List[Product]) -> None:
@@ -72,10 +87,32 @@ class TotalSumTax(TaxDecorator):
             price += price * self.Z / 100
         return price
 
+class CompiledOrder(PriceComponent):
+    def __init__(self, base: float, count: int, is_transfer: bool,
+                 X: float, N: int, Y: float, Z: float, A: float) -> None:
+        self.base: float = base
+        self.count: int = count
+        self.is_transfer: bool = is_transfer
+        self.X: float = X
+        self.N: int = N
+        self.Y: float = Y
+        self.Z: float = Z
+        self.A: float = A
+
+    def get_price(self) -> float:
+        price: float = self.base
+        if self.count > self.N:
+            price += price * self.X / 100
+        if self.is_transfer:
+            price += price * self.Y / 100
+        if price > self.A:
+            price += price * self.Z / 100
+        return price
+
 class OrderBuilder:
     def __init__(self) -> None:
         self.products: List[Product] = []
-        self.method: str = ""
+        self.method: Optional[PaymentMethod] = None
         self.X: float = 0.0
         self.N: int = 0
         self.Y: float = 0.0
@@ -87,20 +124,38 @@ class OrderBuilder:
         return self
 
     def set_payment_method(self, method: str) -> OrderBuilder:
-        self.method = method.lower()
+        self.method = PAYMENT_METHODS.get(method.lower())
         return self
 
     def set_tax_params(self, X: float, N: int, Y: float, Z: float, A: float) -> OrderBuilder:
         self.X, self.N, self.Y, self.Z, self.A = X, N, Y, Z, A
         return self
 
-    def build(self) -> PriceComponent:
+    def build_chain(self) -> PriceComponent:
         base: PriceComponent = BaseOrder(self.products)
         order: PriceComponent = ItemCountTax(base, self.X, self.N, len(self.products))
-        order = TransferTax(order, self.Y, self.method == "переказ")
+        order = TransferTax(order, self.Y, self.method is PaymentMethod.TRANSFER)
         order = TotalSumTax(order, self.Z, self.A)
         return order
 
+    def build(self) -> PriceComponent:
+        base: float = sum(p.quantity * p.price for p in self.products)
+        return CompiledOrder(base, len(self.products), self.method is PaymentMethod.TRANSFER,
+                             self.X, self.N, self.Y, self.Z, self.A)
+
+def price_orders_batch(qty: np.ndarray, price: np.ndarray, offsets: np.ndarray,
+                       is_transfer: np.ndarray, X: float, N: int, Y: float,
+                       Z: float, A: float) -> np.ndarray:
+    # Замовлення задані у CSR-форматі: товари замовлення i лежать у
+    # qty/price[offsets[i]:offsets[i+1]].
+    counts: np.ndarray = np.diff(offsets)
+    order_ids: np.ndarray = np.repeat(np.arange(len(counts)), counts)
+    totals: np.ndarray = np.bincount(order_ids, weights=qty * price, minlength=len(counts))
+    totals = np.where(counts > N, totals + totals * X / 100, totals)
+    totals = np.where(is_transfer, totals + totals * Y / 100, totals)
+    totals = np.where(totals > A, totals + totals * Z / 100, totals)
+    return totals
+
 if __name__ == "__main__":
     print(" Створення замовлення ")
     builder: OrderBuilder = OrderBuilder()
@@ -1,9 +1,9 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date
-from typing import List, Protocol
+from typing import Dict, List, Protocol
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     title: str
     description: str
@@ -20,18 +20,16 @@ class Observer(Protocol):
 class SubjectPublisher:
     def __init__(self, subject_name: str) -> None:
         self.subject: str = subject_name
-        self._observers: List[Observer] = []
+        self._observers: Dict[int, Observer] = {}
 
     def attach(self, observer: Observer) -> None:
-        if observer not in self._observers:
-            self._observers.append(observer)
+        self._observers.setdefault(id(observer), observer)
 
     def detach(self, observer: Observer) -> None:
-        if observer in self._observers:
-            self._observers.remove(observer)
+        self._observers.pop(id(observer), None)
 
     def notify(self, task: Task) -> None:
-        for obs in list(self._observers):
+        for obs in list(self._observers.values()):
             obs.update(task)
 
     def publish_task(self, title: str, description: str, due: date) -> Task: